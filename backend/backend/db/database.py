@@ -20,11 +20,38 @@ from sqlalchemy.orm import sessionmaker
 
 SQLALCHEMY_DATABASE_URL = os.getenv('DATABASE_URL')
 
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'false').lower() in ('1', 'true', 'yes')
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def reset_engine_after_fork(warm_connections: int = 0):
+    """
+    Drop pooled connections inherited from the parent process so the child
+    opens its own, then optionally pre-open a few so the first task doesn't
+    pay the connect cost.
+    """
+    # close=False leaves the parent's sockets alone; the child just forgets them
+    engine.dispose(close=False)
+
+    connections = []
+    try:
+        for _ in range(min(warm_connections, DB_POOL_SIZE)):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
 def get_db():
     db = SessionLocal()
     try:
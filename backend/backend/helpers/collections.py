@@ -1,5 +1,7 @@
 import uuid
 from fastapi import HTTPException
+from sqlalchemy import Integer, bindparam, exists, func
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
 from backend.db import database
 
@@ -13,43 +15,59 @@ def get_all_company_ids(db: Session, collection_id):
     
     return [assoc.company_id for assoc in all_company_associations]
 
-def validate_collection_exists(db: Session, collection_id: uuid.UUID, collection_type: str):
+def validate_collections_exist(db: Session, from_collection_id: uuid.UUID, to_collection_id: uuid.UUID):
     """
-    Validate a collection exists
+    Validate both source and destination collections exist in a single query
     """
-    collection = db.query(database.CompanyCollection).filter(
-        database.CompanyCollection.id == collection_id
-    ).first()
+    collections = db.query(database.CompanyCollection).filter(
+        database.CompanyCollection.id.in_([from_collection_id, to_collection_id])
+    ).all()
+    collections_by_id = {collection.id: collection for collection in collections}
 
-    if not collection:
-        raise HTTPException(
-            status_code=404,
-            detail=f"{collection_type} collection {collection_id} not found"
+    for collection_id, collection_type in ((from_collection_id, "Source"), (to_collection_id, "Destination")):
+        if collection_id not in collections_by_id:
+            raise HTTPException(
+                status_code=404,
+                detail=f"{collection_type} collection {collection_id} not found"
+            )
+
+    return collections_by_id[from_collection_id], collections_by_id[to_collection_id]
+
+
+def get_missing_company_ids(db: Session, company_ids: list[int], collection_id: uuid.UUID) -> list[int]:
+    """
+    Return the ids from company_ids that aren't in the collection.
+    The ids are sent as one array parameter and unnested server side.
+    """
+    requested = (
+        func.unnest(bindparam("company_ids", company_ids, type_=ARRAY(Integer)))
+        .table_valued("company_id")
+        .render_derived(name="requested")
+    )
+
+    missing = db.query(requested.c.company_id).distinct().filter(
+        ~exists().where(
+            database.CompanyCollectionAssociation.company_id == requested.c.company_id,
+            database.CompanyCollectionAssociation.collection_id == collection_id
         )
+    ).all()
 
-    return collection
+    return [company_id for (company_id,) in missing]
 
 
 def validate_companies_in_collection(db: Session, company_ids: list[int], collection_id: uuid.UUID):
     """
     Validate companies exist in the specified collection
     """
-    existing_associations = db.query(database.CompanyCollectionAssociation).filter(
-        database.CompanyCollectionAssociation.company_id.in_(company_ids),
-        database.CompanyCollectionAssociation.collection_id == collection_id
-    ).all()
-
-    found_company_ids = {assoc.company_id for assoc in existing_associations}
-    missing_company_ids = set(company_ids) - found_company_ids
+    missing_company_ids = get_missing_company_ids(db, company_ids, collection_id)
 
     if missing_company_ids:
         raise HTTPException(
             status_code=400,
-            detail=f"Companies {list(missing_company_ids)} not found in source collection"
+            detail=f"Companies {missing_company_ids} not found in source collection"
         )
 
 
-
 def association_exists(db: Session, company_id: int, collection_id: uuid.UUID) -> bool:
     """
     Check if a company-collection association already exists
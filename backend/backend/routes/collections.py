@@ -1,25 +1,32 @@
+import os
 import uuid
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, aliased
 
 from backend.db import database
 from backend.tasks import start_bulk_move as start_bulk_move_task
 from celery_app import celery_app
 from backend.routes.companies import (
     CompanyBatchOutput,
+    CompanyOutput,
     fetch_companies_with_liked,
 )
 from backend.helpers.collections import (
-    validate_collection_exists,
+    validate_collections_exist,
     validate_companies_in_collection,
     delete_company_association,
     association_exists,
     create_company_association
 )
 
+# /move-companies requests larger than this are handed off to the bulk-move task.
+# Each insert is throttled by ~100ms (see main.py), so 20 ids is roughly a 2s request.
+MOVE_COMPANIES_ASYNC_THRESHOLD = int(os.getenv("MOVE_COMPANIES_ASYNC_THRESHOLD", "20"))
+
 router = APIRouter(
     prefix="/collections",
     tags=["collections"],
@@ -44,6 +51,7 @@ class MoveCompaniesRequest(BaseModel):
 class MoveCompaniesResponse(BaseModel):
     moved_count: int
     message: str
+    operation_id: Optional[str] = None
 
 
 class BulkMoveRequest(BaseModel):
@@ -83,6 +91,75 @@ def get_all_collection_metadata(
     ]
 
 
+@router.get("/summary", response_model=list[CompanyCollectionOutput])
+def get_collections_summary(
+    limit: int = Query(10, description="The number of companies to fetch per collection"),
+    db: Session = Depends(database.get_db),
+):
+    """
+    Every collection with its total and first page of companies.
+    Runs a fixed two queries no matter how many collections there are.
+    """
+    Association = database.CompanyCollectionAssociation
+
+    collections = (
+        db.query(database.CompanyCollection, func.count(Association.id))
+        .outerjoin(Association, Association.collection_id == database.CompanyCollection.id)
+        .group_by(database.CompanyCollection.id)
+        .order_by(database.CompanyCollection.created_at)
+        .all()
+    )
+
+    ranked = db.query(
+        Association.collection_id,
+        Association.company_id,
+        func.row_number()
+        .over(partition_by=Association.collection_id, order_by=Association.id)
+        .label("position"),
+    ).subquery()
+
+    liked_list_id = (
+        db.query(database.CompanyCollection.id)
+        .filter(database.CompanyCollection.collection_name == "Liked Companies List")
+        .limit(1)
+        .scalar_subquery()
+    )
+    liked = aliased(Association)
+
+    page_rows = (
+        db.query(
+            ranked.c.collection_id,
+            database.Company.id,
+            database.Company.company_name,
+            liked.id.isnot(None),
+        )
+        .join(database.Company, database.Company.id == ranked.c.company_id)
+        .outerjoin(
+            liked,
+            and_(liked.company_id == ranked.c.company_id, liked.collection_id == liked_list_id),
+        )
+        .filter(ranked.c.position <= limit)
+        .order_by(ranked.c.collection_id, ranked.c.position)
+        .all()
+    )
+
+    companies_by_collection: dict[uuid.UUID, list[CompanyOutput]] = {}
+    for collection_id, company_id, company_name, is_liked in page_rows:
+        companies_by_collection.setdefault(collection_id, []).append(
+            CompanyOutput(id=company_id, company_name=company_name, liked=is_liked)
+        )
+
+    return [
+        CompanyCollectionOutput(
+            id=collection.id,
+            collection_name=collection.collection_name,
+            companies=companies_by_collection.get(collection.id, []),
+            total=total,
+        )
+        for collection, total in collections
+    ]
+
+
 @router.get("/{collection_id}", response_model=CompanyCollectionOutput)
 def get_company_collection_by_id(
     collection_id: uuid.UUID,
@@ -100,8 +177,18 @@ def get_company_collection_by_id(
 
     total_count = query.with_entities(func.count()).scalar()
 
-    results = query.offset(offset).limit(limit).all()
-    companies = fetch_companies_with_liked(db, [company.id for _, company in results])
+    # Same ordering as /collections/summary so both agree on the first page
+    results = (
+        query.order_by(database.CompanyCollectionAssociation.id)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    page_positions = {company.id: position for position, (_, company) in enumerate(results)}
+    companies = sorted(
+        fetch_companies_with_liked(db, list(page_positions)),
+        key=lambda company: page_positions[company.id],
+    )
 
     return CompanyCollectionOutput(
         id=collection_id,
@@ -120,13 +207,26 @@ def move_companies(
 ):
     """
     Move companies from one collection to another synchronously
-    (Meant for a small batch of moves. Use /bulk-move-all for larger amounts)
+    (Meant for a small batch of moves. Use /bulk-move for larger amounts)
 
+    Requests with more than MOVE_COMPANIES_ASYNC_THRESHOLD companies are queued
+    on the bulk-move task instead; poll /bulk-move-status with the returned operation_id.
     """
-    from_collection = validate_collection_exists(db, request.from_collection_id, "Source")
-    to_collection = validate_collection_exists(db, request.to_collection_id, "Destination")
+    from_collection, to_collection = validate_collections_exist(
+        db, request.from_collection_id, request.to_collection_id
+    )
     validate_companies_in_collection(db, request.company_ids, request.from_collection_id)
 
+    if len(request.company_ids) > MOVE_COMPANIES_ASYNC_THRESHOLD:
+        result = start_bulk_move_task.delay(
+            request.from_collection_id, request.to_collection_id, request.company_ids
+        )
+        return MoveCompaniesResponse(
+            moved_count=0,
+            message=f"Queued move of {len(request.company_ids)} companies from {from_collection.collection_name} to {to_collection.collection_name}",
+            operation_id=result.id
+        )
+
     try:
         moved_count = 0
 
@@ -1,5 +1,6 @@
 from celery_app import celery_app
 import uuid
+from backend.db import database
 from backend.helpers.collections import (
     delete_company_association,
     association_exists,
@@ -17,8 +18,6 @@ def bulk_move_companies_batch(company_ids: list[int], from_collection_id: uuid.U
     Moves a batch of companies from one collection to another.
     Handles individual failures gracefully - continues processing remaining companies.
     '''
-    from backend.db import database
-
     db = database.SessionLocal()
     moved_count = 0
     failed_companies = []
@@ -75,8 +74,6 @@ def start_bulk_move(from_collection_id: uuid.UUID, to_collection_id: uuid.UUID,
     Splits collection companies into batches for workers to move from one collection to another.
     If company_ids is provided, only move those companies. Otherwise, move all companies.
     '''
-    from backend.db import database
-
     db = database.SessionLocal()
 
     if company_ids:
@@ -1,7 +1,14 @@
+import logging
 import os
 from celery import Celery
+from celery.signals import worker_process_init
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+WORKER_PREFETCH_MULTIPLIER = int(os.getenv("CELERY_WORKER_PREFETCH_MULTIPLIER", "1"))
+WORKER_MAX_TASKS_PER_CHILD = int(os.getenv("CELERY_WORKER_MAX_TASKS_PER_CHILD", "1000"))
+WORKER_DB_WARM_CONNECTIONS = int(os.getenv("CELERY_WORKER_DB_WARM_CONNECTIONS", "1"))
+
+logger = logging.getLogger(__name__)
 
 celery_app = Celery(
     "backend",
@@ -14,4 +21,24 @@ celery_app.conf.update(
     timezone="UTC",
     enable_utc=True,
     result_expires=3600,
-)
\ No newline at end of file
+    # Batch tasks hold a DB transaction for a while, so only ack once they finish
+    # and don't let one process hoard queued batches while it's busy.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=WORKER_PREFETCH_MULTIPLIER,
+    # Recycle child processes periodically to cap memory and connection drift
+    worker_max_tasks_per_child=WORKER_MAX_TASKS_PER_CHILD,
+)
+
+
+@worker_process_init.connect
+def init_worker_db(**kwargs):
+    '''
+    Give each forked worker process its own connection pool and warm it up.
+    '''
+    from backend.db import database
+
+    try:
+        database.reset_engine_after_fork(WORKER_DB_WARM_CONNECTIONS)
+    except Exception as e:
+        logger.warning(f"Failed to warm DB pool in worker process: {e}")
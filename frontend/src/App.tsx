@@ -3,8 +3,8 @@ import "./App.css";
 import CssBaseline from "@mui/material/CssBaseline";
 import { createTheme, ThemeProvider } from "@mui/material/styles";
 import { useEffect, useState } from "react";
-import CompanyTable from "./components/CompanyTable";
-import { getCollectionsMetadata, ICollection } from "./utils/jam-api";
+import CompanyTable, { DEFAULT_PAGE_SIZE } from "./components/CompanyTable";
+import { getCollectionsSummary, ICollection } from "./utils/jam-api";
 import useApi from "./utils/useApi";
 
 const darkTheme = createTheme({
@@ -15,7 +15,7 @@ const darkTheme = createTheme({
 
 function App() {
   const [selectedCollectionId, setSelectedCollectionId] = useState<string>();
-  const { data: collectionResponse } = useApi(() => getCollectionsMetadata());
+  const { data: collectionResponse } = useApi(() => getCollectionsSummary(DEFAULT_PAGE_SIZE));
 
   useEffect(() => {
     setSelectedCollectionId(collectionResponse?.[0]?.id);
@@ -1,10 +1,12 @@
 import { DataGrid, GridRowSelectionModel } from "@mui/x-data-grid";
-import { useCallback, useEffect, useState } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
 import { getCollectionsById, ICompany, ICollection } from "../utils/jam-api";
 import CompanyTableToolbar from "./CompanyTableToolbar";
 import CompanyMoveMenu from "./CompanyMoveMenu";
 import { IconButton } from "@mui/material";
 
+export const DEFAULT_PAGE_SIZE = 25;
+
 const CompanyTable = ({
   selectedCollectionId,
   allCollections,
@@ -18,7 +20,12 @@ const CompanyTable = ({
   const [error, setError] = useState<string | null>(null);
 
   const [offset, setOffset] = useState<number>(0);
-  const [pageSize, setPageSize] = useState(25);
+  const [pageSize, setPageSize] = useState(DEFAULT_PAGE_SIZE);
+
+  // allCollections comes from /collections/summary, which already holds the
+  // first page of each collection. Use it once for first paint; after that
+  // (e.g. once a move happens) it may be stale, so always fetch.
+  const usedSummaryPage = useRef(false);
 
   const [selectedCompanyIds, setSelectedCompanyIds] =
     useState<GridRowSelectionModel>([]);
@@ -31,6 +38,18 @@ const CompanyTable = ({
   const fetchCollections = useCallback(async () => {
     if (!selectedCollectionId) return;
 
+    if (!usedSummaryPage.current && offset === 0 && pageSize === DEFAULT_PAGE_SIZE) {
+      usedSummaryPage.current = true;
+      const summary = allCollections?.find(
+        (collection) => collection.id === selectedCollectionId
+      );
+      if (summary?.companies) {
+        setResponse(summary.companies);
+        setTotal(summary.total);
+        return;
+      }
+    }
+
     setLoading(true);
     setError(null);
 
@@ -51,7 +70,7 @@ const CompanyTable = ({
     } finally {
       setLoading(false);
     }
-  }, [selectedCollectionId, offset, pageSize]);
+  }, [selectedCollectionId, offset, pageSize, allCollections]);
 
   const resetSelections = () => {
     setOffset(0);
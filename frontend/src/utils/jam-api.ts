@@ -25,6 +25,7 @@ export interface IMoveCompaniesRequest {
 export interface IMoveCompaniesResponse {
   moved_count: number;
   message: string;
+  operation_id?: string; // Set when a large request was queued as a bulk move
 }
 
 export interface IBulkMoveRequest {
@@ -97,6 +98,22 @@ export async function getCollectionsMetadata(): Promise<ICollection[]> {
   }
 }
 
+export async function getCollectionsSummary(
+  limit?: number
+): Promise<ICollection[]> {
+  try {
+    const response = await axios.get(`${BASE_URL}/collections/summary`, {
+      params: {
+        limit,
+      },
+    });
+    return response.data;
+  } catch (error) {
+    console.error("Error fetching collections summary:", error);
+    throw error;
+  }
+}
+
 export async function moveCompaniesToCollections(
   reqData: IMoveCompaniesRequest
 ): Promise<IMoveCompaniesResponse> {